@@ -7,50 +7,210 @@ Provides:
 - Blog fetching endpoint that proxies Hashnode GraphQL via `mongodb_conn.getBlogs`
 
 This file uses the helper functions defined in `mongodb_conn.py`:
-- post_data
+- post_data / post_many
 - get_data
-- get_multiple_data
-- data_update
+- get_multiple_data / stream_data
+- data_update / data_update_many
 - data_delete
 - getBlogs
+
+Write endpoints require the admin password via the `require_admin` dependency;
+database errors are turned into 500 responses by a single exception handler.
 """
 
-import json
+import base64
+import hmac
 import os
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+import orjson
+from bson import Decimal128, ObjectId
+from bson.errors import InvalidId
+from fastapi import (
+    Body,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
+from pymongo.errors import BulkWriteError, PyMongoError
+
+# The image ships its secrets in .env (see .github/workflows/gcr.yml), so load
+# it by default. Deployments that inject env vars directly can set ENV=prod to
+# skip the lookup. This must run before mongodb_conn is imported and
+# ADMIN_PASS is read.
+if os.getenv("ENV") != "prod":
+    from dotenv import load_dotenv
 
-from bson import ObjectId
-from fastapi import Body, FastAPI, Header, HTTPException, status
+    load_dotenv()
 
 # Import repository functions
 from mongodb_conn import (
+    MAX_BLOG_POSTS,
+    close_http_client,
     data_delete,
     data_update,
+    data_update_many,
     get_data,
     get_multiple_data,
     getBlogs,
     post_data,
+    post_many,
+    stream_data,
 )
 
-app = FastAPI(title="Pratyay Profile Backend API", version="1.0")
+_ADMIN_PASS = (os.getenv("ADMIN_PASS") or "").encode()
 
 
-def serialize_doc(doc: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def _check(password: Optional[str]) -> bool:
     """
-    Convert a MongoDB document to a JSON-serializable dict.
-    Specifically, convert ObjectId to str for the `_id` field.
+    Constant-time comparison of a supplied password against ADMIN_PASS.
+    Always fails when ADMIN_PASS is unset.
     """
-    if doc is None:
-        return None
-    out = dict(doc)
-    _id = out.get("_id")
+    return (
+        bool(_ADMIN_PASS)
+        and password is not None
+        and hmac.compare_digest(_ADMIN_PASS, password.encode())
+    )
+
+
+async def require_admin(
+    x_password: Optional[str] = Header(None, alias="X-Password"),
+) -> None:
+    """
+    Dependency guarding write endpoints behind the admin password.
+    """
+    if not _check(x_password):
+        raise HTTPException(
+            status_code=403,
+            detail="Forbidden: invalid admin password for users collection",
+        )
+
+
+def _oid(value: str) -> ObjectId:
+    """
+    Parse a 24-character hex string into an ObjectId, raising a 400 otherwise.
+    """
+    if len(value) != 24:
+        raise HTTPException(status_code=400, detail="Invalid ObjectId format")
     try:
-        if _id is not None:
-            out["_id"] = str(_id)
-    except Exception:
-        # if conversion fails, leave as-is (FastAPI/JSON encoder will likely fail later)
-        out["_id"] = out.get("_id")
-    return out
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid ObjectId format")
+
+
+def _parse_query(raw: Optional[str]) -> Dict[str, Any]:
+    """
+    Decode a JSON-encoded query string, raising a 400 if it is not a JSON object.
+    """
+    if not raw:
+        return {}
+    try:
+        query = orjson.loads(raw)
+    except orjson.JSONDecodeError as je:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON for query: {je}")
+    if not isinstance(query, dict):
+        raise HTTPException(status_code=400, detail="Query must be a JSON object")
+    return query
+
+
+def _projection(fields: Optional[str]) -> Optional[Dict[str, int]]:
+    """
+    Build a MongoDB projection from a comma-separated list of field names.
+    Returns None (full documents) when no fields are given.
+    """
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    return {name: 1 for name in names} or None
+
+
+def _write_errors(exc: BulkWriteError) -> List[Dict[str, Any]]:
+    """
+    Summarize the per-item failures of a partially applied unordered bulk write.
+    Each entry keeps the index of the payload item that failed.
+    """
+    return [
+        {
+            "index": err["index"],
+            "code": err.get("code"),
+            "errmsg": err.get("errmsg"),
+        }
+        for err in exc.details.get("writeErrors", [])
+    ]
+
+
+def _write_concern_errors(exc: BulkWriteError) -> List[Dict[str, Any]]:
+    """
+    Summarize the write concern failures of a bulk write. When present, the
+    writes that did succeed are not confirmed as durably committed.
+    """
+    return [
+        {"code": err.get("code"), "errmsg": err.get("errmsg")}
+        for err in exc.details.get("writeConcernErrors", [])
+    ]
+
+
+def _default(obj: Any) -> Any:
+    """
+    Fallback encoder for types orjson does not handle natively.
+    ObjectId and decimals become strings; bytes (including bson.Binary) are
+    always base64-encoded. Anything else raises TypeError.
+    """
+    if isinstance(obj, (ObjectId, Decimal128, Decimal)):
+        return str(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib encoder.
+    datetime and UUID values are handled natively; BSON types go through `_default`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Release shared outbound connections on shutdown.
+    """
+    yield
+    await close_http_client()
+
+
+app = FastAPI(
+    title="Pratyay Profile Backend API",
+    version="1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+
+@app.exception_handler(PyMongoError)
+async def pymongo_error_handler(request: Request, exc: PyMongoError):
+    """
+    Report database failures from any route as a 500 JSON response.
+    """
+    return ORJSONResponse(status_code=500, content={"detail": f"Database error: {exc}"})
+
+
+@app.exception_handler(Exception)
+async def unhandled_error_handler(request: Request, exc: Exception):
+    """
+    Report any other unexpected failure as a 500 JSON response.
+    """
+    return ORJSONResponse(status_code=500, content={"detail": f"Server error: {exc}"})
 
 
 @app.get("/health", tags=["health"])
@@ -61,67 +221,153 @@ async def health():
     return {"status": "ok"}
 
 
-@app.post("/message", status_code=status.HTTP_201_CREATED)
+@app.post(
+    "/message",
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_admin)],
+)
 async def create_data(
     database: str,
     collection: str,
     payload: Dict[str, Any] = Body(...),
-    x_password: Optional[str] = Header(None, alias="X-Password"),
 ):
     """
     Insert a document into the given database and collection.
     Body: arbitrary JSON object to insert.
     Returns the inserted document id.
     """
+    result = await post_data(database, collection, payload)
+    inserted_id = getattr(result, "inserted_id", None)
+    return {"inserted_id": str(inserted_id) if inserted_id is not None else None}
+
+
+@app.post(
+    "/data/bulk",
+    status_code=status.HTTP_201_CREATED,
+    tags=["data"],
+    dependencies=[Depends(require_admin)],
+)
+async def create_data_bulk(
+    database: str,
+    collection: str,
+    payload: List[Dict[str, Any]] = Body(...),
+):
+    """
+    Insert many documents into the given database and collection at once.
+    Body: JSON array of objects to insert.
+    Returns the inserted document ids, or 207 with the ids that were written
+    and per-item `write_errors` if some inserts failed. If the write concern
+    was not met, written ids are listed under `unconfirmed_ids` instead, next
+    to `write_concern_errors`.
+    """
+    if not payload:
+        raise HTTPException(status_code=400, detail="Payload must not be empty")
     try:
-        # Restrict create for users collection unless admin password matches
-        admin_pass = os.getenv("ADMIN_PASS")
-        if not admin_pass or x_password != admin_pass:
-            raise HTTPException(
-                status_code=403,
-                detail="Forbidden: invalid admin password for users collection",
-            )
-        result = await post_data(database, collection, payload)
-        inserted_id = getattr(result, "inserted_id", None)
-        return {"inserted_id": str(inserted_id) if inserted_id is not None else None}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to insert data: {e}")
+        result = await post_many(database, collection, payload)
+    except BulkWriteError as e:
+        # Unordered inserts keep going past failures; report what was written.
+        # insert_many sets `_id` on every payload document before sending it.
+        failed = {err["index"] for err in e.details.get("writeErrors", [])}
+        written = [str(doc["_id"]) for i, doc in enumerate(payload) if i not in failed]
+        concern_errors = _write_concern_errors(e)
+        # Without the requested write concern, written ids are not confirmed
+        return ORJSONResponse(
+            status_code=status.HTTP_207_MULTI_STATUS,
+            content={
+                "inserted_ids": [] if concern_errors else written,
+                "unconfirmed_ids": written if concern_errors else [],
+                "write_errors": _write_errors(e),
+                "write_concern_errors": concern_errors,
+            },
+        )
+    return {"inserted_ids": [str(i) for i in result.inserted_ids]}
 
 
-@app.get("/data", tags=["data"])
+@app.put("/data/bulk", tags=["data"], dependencies=[Depends(require_admin)])
+async def update_data_bulk(
+    database: str,
+    collection: str,
+    payload: List[Dict[str, Any]] = Body(...),
+):
+    """
+    Update many documents by ObjectId at once.
+    Body: JSON array of objects, each with an `_id` and the fields to set.
+    Returns modified and matched counts, or 207 with the counts that were
+    applied, per-item `write_errors` and any `write_concern_errors` if the
+    bulk write did not fully succeed.
+    """
+    updates = []
+    for item in payload:
+        fields = dict(item)
+        raw_id = fields.pop("_id", None)
+        if not isinstance(raw_id, str):
+            raise HTTPException(status_code=400, detail="Each item needs an _id")
+        updates.append(({"_id": _oid(raw_id)}, {"$set": fields}))
+    if not updates:
+        raise HTTPException(status_code=400, detail="Payload must not be empty")
+    try:
+        result = await data_update_many(database, collection, updates)
+    except BulkWriteError as e:
+        # Unordered updates keep going past failures; report what was applied
+        return ORJSONResponse(
+            status_code=status.HTTP_207_MULTI_STATUS,
+            content={
+                "matched_count": e.details.get("nMatched", 0),
+                "modified_count": e.details.get("nModified", 0),
+                "write_errors": _write_errors(e),
+                "write_concern_errors": _write_concern_errors(e),
+            },
+        )
+    return {
+        "matched_count": result.matched_count,
+        "modified_count": result.modified_count,
+    }
+
+
+@app.get("/data", tags=["data"], response_class=ORJSONResponse)
 async def list_data(
     database: str,
     collection: str,
     q: Optional[str] = None,
-    limit: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=0),
+    fields: Optional[str] = None,
 ):
     """
     List documents from a collection.
     - q: optional JSON-encoded query string (e.g. '{"name": "Alice"}')
     - limit: optional integer to limit number of results
+    - fields: optional comma-separated field names to return (e.g. 'name,email');
+      prefer this over fetching full documents when only a few fields are needed
     """
-    try:
-        query = {}
-        if q:
-            try:
-                query = json.loads(q)
-                if not isinstance(query, dict):
-                    raise ValueError("Query must be a JSON object")
-            except json.JSONDecodeError as je:
-                raise HTTPException(
-                    status_code=400, detail=f"Invalid JSON for query: {je}"
-                )
-        if limit is None:
-            results = await get_multiple_data(database, collection, query)
-        else:
-            results = await get_multiple_data(database, collection, query, int(limit))
-        return [serialize_doc(r) for r in results]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to list data: {e}")
+    query = _parse_query(q)
+    results = await get_multiple_data(
+        database, collection, query, limit, _projection(fields)
+    )
+    return ORJSONResponse(results)
+
+
+@app.get("/data/stream", tags=["data"])
+async def stream_list_data(
+    database: str,
+    collection: str,
+    q: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=0),
+    fields: Optional[str] = None,
+):
+    """
+    Stream documents from a collection as newline-delimited JSON.
+    Takes the same parameters as /data; parse the body line by line.
+    A failure after streaming has started aborts the response mid-body.
+    """
+    query = _parse_query(q)
+    # Awaiting here runs the query, so startup errors still map to a 500
+    docs = await stream_data(database, collection, query, limit, _projection(fields))
+
+    async def ndjson():
+        async for doc in docs:
+            yield orjson.dumps(doc, default=_default, option=orjson.OPT_APPEND_NEWLINE)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 @app.get("/data/{database}/{collection}/{id}", tags=["data"])
@@ -129,107 +375,72 @@ async def get_document(database: str, collection: str, id: str):
     """
     Get a single document by its ObjectId.
     """
-    try:
-        oid = ObjectId(id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid ObjectId format")
-    try:
-        result = await get_data(database, collection, {"_id": oid})
-        doc = serialize_doc(result)
-        if not doc:
-            raise HTTPException(status_code=404, detail="Document not found")
-        return doc
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch document: {e}")
+    oid = _oid(id)
+    result = await get_data(database, collection, {"_id": oid})
+    if not result:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return ORJSONResponse(result)
 
 
-@app.put("/data/{database}/{collection}/{id}", tags=["data"])
+@app.put(
+    "/data/{database}/{collection}/{id}",
+    tags=["data"],
+    dependencies=[Depends(require_admin)],
+)
 async def update_document(
     database: str,
     collection: str,
     id: str,
     payload: Dict[str, Any] = Body(...),
-    x_password: Optional[str] = Header(None, alias="X-Password"),
 ):
     """
     Update fields of an existing document by ObjectId.
     Body: fields to set (partial update).
     Returns modified and matched counts.
     """
-    try:
-        oid = ObjectId(id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid ObjectId format")
-    try:
-        # Restrict update for users collection unless admin password matches
-        admin_pass = os.getenv("ADMIN_PASS")
-        if not admin_pass or x_password != admin_pass:
-            raise HTTPException(
-                status_code=403,
-                detail="Forbidden: invalid admin password for users collection",
-            )
-        result = await data_update(
-            database, collection, {"_id": oid}, {"$set": payload}
-        )
-        # result is UpdateResult
-        matched = getattr(result, "matched_count", None)
-        modified = getattr(result, "modified_count", None)
-        return {"matched_count": matched, "modified_count": modified}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to update document: {e}")
-
-
-@app.delete("/data/{database}/{collection}/{id}", tags=["data"])
+    oid = _oid(id)
+    result = await data_update(database, collection, {"_id": oid}, {"$set": payload})
+    # result is UpdateResult
+    matched = getattr(result, "matched_count", None)
+    modified = getattr(result, "modified_count", None)
+    return {"matched_count": matched, "modified_count": modified}
+
+
+@app.delete(
+    "/data/{database}/{collection}/{id}",
+    tags=["data"],
+    dependencies=[Depends(require_admin)],
+)
 async def delete_document(
     database: str,
     collection: str,
     id: str,
-    x_password: Optional[str] = Header(None, alias="X-Password"),
 ):
     """
     Delete a single document by ObjectId.
     Returns deleted count.
     """
-    try:
-        oid = ObjectId(id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid ObjectId format")
-    try:
-        # Restrict delete for users collection unless admin password matches
-        admin_pass = os.getenv("ADMIN_PASS")
-        if not admin_pass or x_password != admin_pass:
-            raise HTTPException(
-                status_code=403,
-                detail="Forbidden: invalid admin password for users collection",
-            )
-        result = await data_delete(database, collection, {"_id": oid})
-        deleted = getattr(result, "deleted_count", None)
-        return {"deleted_count": deleted}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete document: {e}")
+    oid = _oid(id)
+    result = await data_delete(database, collection, {"_id": oid})
+    deleted = getattr(result, "deleted_count", None)
+    return {"deleted_count": deleted}
 
 
-@app.get("/blogs", tags=["blogs"])
-async def get_blogs(num: int = 10):
+@app.get("/blogs", tags=["blogs"], response_class=ORJSONResponse)
+async def get_blogs(num: int = Query(10, ge=1, le=MAX_BLOG_POSTS)):
     """
     Fetch recent blog posts from a configured Hashnode publication.
-    - num: number of posts to fetch (default 10)
+    - num: number of posts to fetch (default 10, at most MAX_BLOG_POSTS)
     """
     try:
         posts = await getBlogs(num)
-        sanitized = []
-        for edge in posts:
-            node = edge.get("node") if isinstance(edge, dict) else None
-            if node:
-                # no ObjectId conversion expected here; leave as returned
-                sanitized.append(node)
-        return sanitized
+        # Return the encoded response directly so FastAPI skips jsonable_encoder
+        nodes = [
+            edge["node"]
+            for edge in posts
+            if isinstance(edge, dict) and edge.get("node")
+        ]
+        return ORJSONResponse(nodes)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch blogs: {e}")
 
@@ -244,12 +455,16 @@ async def get_blogs(num: int = 10):
 # - X-Limit: integer limit
 
 
-@app.post("/data/headers", status_code=status.HTTP_201_CREATED, tags=["data"])
+@app.post(
+    "/data/headers",
+    status_code=status.HTTP_201_CREATED,
+    tags=["data"],
+    dependencies=[Depends(require_admin)],
+)
 async def create_data_headers(
     x_database: str = Header(..., alias="X-Database"),
     x_collection: str = Header(..., alias="X-Collection"),
     payload: Dict[str, Any] = Body(...),
-    x_password: Optional[str] = Header(None, alias="X-Password"),
 ):
     """
     Insert a document using headers for database and collection.
@@ -258,21 +473,9 @@ async def create_data_headers(
     - X-Collection
     Body: arbitrary JSON object to insert.
     """
-    try:
-        # Restrict create for users collection unless admin password matches
-        admin_pass = os.getenv("ADMIN_PASS")
-        if not admin_pass or x_password != admin_pass:
-            raise HTTPException(
-                status_code=403,
-                detail="Forbidden: invalid admin password for users collection",
-            )
-        result = await post_data(x_database, x_collection, payload)
-        inserted_id = getattr(result, "inserted_id", None)
-        return {"inserted_id": str(inserted_id) if inserted_id is not None else None}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to insert data: {e}")
+    result = await post_data(x_database, x_collection, payload)
+    inserted_id = getattr(result, "inserted_id", None)
+    return {"inserted_id": str(inserted_id) if inserted_id is not None else None}
 
 
 @app.get("/data/headers", tags=["data"])
@@ -280,7 +483,8 @@ async def list_data_headers(
     x_database: str = Header(..., alias="X-Database"),
     x_collection: str = Header(..., alias="X-Collection"),
     x_query: Optional[str] = Header(None, alias="X-Query"),
-    x_limit: Optional[int] = Header(None, alias="X-Limit"),
+    x_limit: Optional[int] = Header(None, alias="X-Limit", ge=0),
+    x_fields: Optional[str] = Header(None, alias="X-Fields"),
 ):
     """
     List documents using headers for database and collection.
@@ -290,29 +494,13 @@ async def list_data_headers(
     Optional:
     - X-Query: JSON-encoded query string
     - X-Limit: integer limit
+    - X-Fields: comma-separated field names to return
     """
-    try:
-        query = {}
-        if x_query:
-            try:
-                query = json.loads(x_query)
-                if not isinstance(query, dict):
-                    raise ValueError("Query must be a JSON object")
-            except json.JSONDecodeError as je:
-                raise HTTPException(
-                    status_code=400, detail=f"Invalid JSON for query: {je}"
-                )
-        if x_limit is None:
-            results = await get_multiple_data(x_database, x_collection, query)
-        else:
-            results = await get_multiple_data(
-                x_database, x_collection, query, int(x_limit)
-            )
-        return [serialize_doc(r) for r in results]
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to list data: {e}")
+    query = _parse_query(x_query)
+    results = await get_multiple_data(
+        x_database, x_collection, query, x_limit, _projection(x_fields)
+    )
+    return ORJSONResponse(results)
 
 
 @app.get("/data/headers/document", tags=["data"])
@@ -328,29 +516,19 @@ async def get_document_headers(
     - X-Collection
     - X-Id
     """
-    try:
-        oid = ObjectId(x_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid ObjectId format")
-    try:
-        result = await get_data(x_database, x_collection, {"_id": oid})
-        doc = serialize_doc(result)
-        if not doc:
-            raise HTTPException(status_code=404, detail="Document not found")
-        return doc
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch document: {e}")
+    oid = _oid(x_id)
+    result = await get_data(x_database, x_collection, {"_id": oid})
+    if not result:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return ORJSONResponse(result)
 
 
-@app.put("/data/headers/document", tags=["data"])
+@app.put("/data/headers/document", tags=["data"], dependencies=[Depends(require_admin)])
 async def update_document_headers(
     x_database: str = Header(..., alias="X-Database"),
     x_collection: str = Header(..., alias="X-Collection"),
     x_id: str = Header(..., alias="X-Id"),
     payload: Dict[str, Any] = Body(...),
-    x_password: Optional[str] = Header(None, alias="X-Password"),
 ):
     """
     Update fields of an existing document by ObjectId using headers.
@@ -360,36 +538,22 @@ async def update_document_headers(
     - X-Id
     Body: fields to set (partial update).
     """
-    try:
-        oid = ObjectId(x_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid ObjectId format")
-    try:
-        # Restrict update for users collection unless admin password matches
-        admin_pass = os.getenv("ADMIN_PASS")
-        if not admin_pass or x_password != admin_pass:
-            raise HTTPException(
-                status_code=403,
-                detail="Forbidden: invalid admin password for users collection",
-            )
-        result = await data_update(
-            x_database, x_collection, {"_id": oid}, {"$set": payload}
-        )
-        matched = getattr(result, "matched_count", None)
-        modified = getattr(result, "modified_count", None)
-        return {"matched_count": matched, "modified_count": modified}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to update document: {e}")
+    oid = _oid(x_id)
+    result = await data_update(
+        x_database, x_collection, {"_id": oid}, {"$set": payload}
+    )
+    matched = getattr(result, "matched_count", None)
+    modified = getattr(result, "modified_count", None)
+    return {"matched_count": matched, "modified_count": modified}
 
 
-@app.delete("/data/headers/document", tags=["data"])
+@app.delete(
+    "/data/headers/document", tags=["data"], dependencies=[Depends(require_admin)]
+)
 async def delete_document_headers(
     x_database: str = Header(..., alias="X-Database"),
     x_collection: str = Header(..., alias="X-Collection"),
     x_id: str = Header(..., alias="X-Id"),
-    x_password: Optional[str] = Header(None, alias="X-Password"),
 ):
     """
     Delete a single document by ObjectId using headers.
@@ -398,22 +562,7 @@ async def delete_document_headers(
     - X-Collection
     - X-Id
     """
-    try:
-        oid = ObjectId(x_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid ObjectId format")
-    try:
-        # Restrict delete for users collection unless admin password matches
-        admin_pass = os.getenv("ADMIN_PASS")
-        if not admin_pass or x_password != admin_pass:
-            raise HTTPException(
-                status_code=403,
-                detail="Forbidden: invalid admin password for users collection",
-            )
-        result = await data_delete(x_database, x_collection, {"_id": oid})
-        deleted = getattr(result, "deleted_count", None)
-        return {"deleted_count": deleted}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete document: {e}")
+    oid = _oid(x_id)
+    result = await data_delete(x_database, x_collection, {"_id": oid})
+    deleted = getattr(result, "deleted_count", None)
+    return {"deleted_count": deleted}
@@ -1,28 +1,37 @@
 import os
 from typing import Dict
 
-from dotenv import load_dotenv
-from motor.motor_asyncio import AsyncIOMotorClient
+from cachetools import LRUCache
+from pymongo import AsyncMongoClient
 from pymongo.errors import PyMongoError
 from pymongo.server_api import ServerApi
 
-load_dotenv()
+# Most (database, collection) handles kept memoized at once
+MAX_CACHED_COLLECTIONS = 256
 
 
 class MongoConnectionManager:
     def __init__(self):
-        self._clients: Dict[str, AsyncIOMotorClient] = {}
+        self._clients: Dict[str, AsyncMongoClient] = {}
+        # Bounded: database and collection names come from request input
+        self._collections: LRUCache = LRUCache(maxsize=MAX_CACHED_COLLECTIONS)
         self.uri = os.environ.get("MONGODB_URL")
         if not self.uri:
             raise ValueError("MONGODB_URL environment variable is not set")
 
-        self.client = AsyncIOMotorClient(
+        self.client = AsyncMongoClient(
             self.uri,
             server_api=ServerApi(version="1", strict=True, deprecation_errors=True),
             maxPoolSize=50,
             minPoolSize=10,
             maxIdleTimeMS=30000,
             retryWrites=True,
+            # Prefer zstd, fall back to snappy/zlib if the server lacks it
+            compressors="zstd,snappy,zlib",
+            zlibCompressionLevel=-1,
+            # Reads stay on the primary unless secondary reads are opted into,
+            # e.g. MONGO_READ_PREFERENCE=secondaryPreferred; secondaries may lag
+            readPreference=os.environ.get("MONGO_READ_PREFERENCE", "primary"),
         )
 
     def get_database(self, database_name: str):
@@ -31,13 +40,17 @@ class MongoConnectionManager:
 
     def get_collection(self, database_name: str, collection_name: str):
         """Get a reference to a specific collection in a database."""
-        db = self.get_database(database_name)
-        return db[collection_name]
-
-    def close_connection(self):
+        key = (database_name, collection_name)
+        collection = self._collections.get(key)
+        if collection is None:
+            collection = self.client[database_name][collection_name]
+            self._collections[key] = collection
+        return collection
+
+    async def close_connection(self):
         """Close the MongoDB client connection."""
         if self.client:
-            self.client.close()
+            await self.client.close()
 
     async def ping(self):
         """Test the connection to the MongoDB server."""
@@ -56,6 +69,8 @@ class LazyConnectionManager:
     def _get_instance(self):
         if self._instance is None:
             self._instance = MongoConnectionManager()
+            # Later lookups go straight to the real manager's cached getter
+            self.get_collection = self._instance.get_collection
         return self._instance
 
     def get_database(self, *args, **kwargs):
@@ -64,13 +79,13 @@ class LazyConnectionManager:
     def get_collection(self, *args, **kwargs):
         return self._get_instance().get_collection(*args, **kwargs)
 
-    def close_connection(self):
+    async def close_connection(self):
         if self._instance:
-            return self._instance.close_connection()
+            return await self._instance.close_connection()
         else:
             # If not initialized yet, create and close
             temp_instance = MongoConnectionManager()
-            return temp_instance.close_connection()
+            return await temp_instance.close_connection()
 
     async def ping(self):
         return await self._get_instance().ping()
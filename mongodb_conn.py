@@ -1,14 +1,95 @@
-import os
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from bson import ObjectId
-from dotenv import load_dotenv
+from cachetools import TTLCache
+from pymongo import UpdateOne
 from pymongo.errors import PyMongoError
 
 from mongodb import connection_manager
 
-load_dotenv()
+# Upper bound on documents fetched per cursor round-trip
+MAX_BATCH_SIZE = 500
+
+# Shared client so Hashnode requests reuse pooled HTTP/2 connections.
+# Created on first use and recreated after close_http_client().
+_HTTP: Optional[httpx.AsyncClient] = None
+
+# Point reads by _id cached briefly: (database, collection, id_hex) -> document
+_DOC_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=5)
+
+# Largest post count /blogs accepts; also bounds the blog cache and locks
+MAX_BLOG_POSTS = 20
+
+# Blog edges cached per requested post count: num -> edges
+_TTL = 60.0
+_BLOG_CACHE: TTLCache = TTLCache(maxsize=MAX_BLOG_POSTS, ttl=_TTL)
+_BLOG_LOCKS: Dict[int, asyncio.Lock] = {}
+
+_BLOGS_QUERY = """query Publication($first: Int!) {
+  publication(host: "pratyaywrites.hashnode.dev") {
+    posts(first: $first) {
+      edges {
+        node {
+          id
+          coverImage {
+            url
+          }
+          title
+          brief
+          url
+        }
+      }
+    }
+  }
+}"""
+
+
+def _http_client() -> httpx.AsyncClient:
+    global _HTTP
+    if _HTTP is None or _HTTP.is_closed:
+        _HTTP = httpx.AsyncClient(
+            base_url="https://gql.hashnode.com",
+            http2=True,
+            headers={"Content-Type": "application/json"},
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _HTTP
+
+
+def _doc_cache_key(databaseName: str, collection_name: str, filter: Optional[Dict]):
+    """Return the cache key for a filter of exactly {"_id": ObjectId}, else None."""
+    if filter and len(filter) == 1 and isinstance(filter.get("_id"), ObjectId):
+        return (databaseName, collection_name, str(filter["_id"]))
+    return None
+
+
+def _invalidate(databaseName: str, collection_name: str, filter: Optional[Dict]):
+    key = _doc_cache_key(databaseName, collection_name, filter)
+    if key is not None:
+        _DOC_CACHE.pop(key, None)
+    else:
+        # Arbitrary filters may touch any cached document
+        _DOC_CACHE.clear()
+
+
+def _find(
+    collection,
+    query: dict,
+    limit: Optional[int],
+    projection: Optional[Dict[str, int]],
+):
+    """Build a find() cursor with the shared limit and batch-size rules."""
+    # Projecting only the needed fields cuts wire bytes and decode work;
+    # limit=0 means no limit to PyMongo
+    return collection.find(
+        query,
+        projection,
+        limit=limit or 0,
+        batch_size=min(limit or MAX_BATCH_SIZE, MAX_BATCH_SIZE),
+    )
 
 
 async def post_data(databaseName: str, collection_name: str, data: Dict[str, Any]):
@@ -21,13 +102,32 @@ async def post_data(databaseName: str, collection_name: str, data: Dict[str, Any
         raise
 
 
+async def post_many(
+    databaseName: str, collection_name: str, docs: List[Dict[str, Any]]
+):
+    try:
+        collection = connection_manager.get_collection(databaseName, collection_name)
+        result = await collection.insert_many(docs, ordered=False)
+        return result
+    except PyMongoError as e:
+        print(f"An error occurred while inserting multiple data: {e}")
+        raise
+
+
 async def get_data(databaseName: str, collection_name: str, query: dict = {}):
     try:
+        key = _doc_cache_key(databaseName, collection_name, query)
+        if key is not None:
+            cached = _DOC_CACHE.get(key)
+            if cached is not None:
+                return cached
         collection = connection_manager.get_collection(databaseName, collection_name)
         if query:
             result = await collection.find_one(query)
         else:
             result = await collection.find_one()
+        if key is not None and result is not None:
+            _DOC_CACHE[key] = result
         return result
     except PyMongoError as e:
         print(f"An error occurred while fetching data: {e}")
@@ -35,38 +135,107 @@ async def get_data(databaseName: str, collection_name: str, query: dict = {}):
 
 
 async def get_multiple_data(
-    databaseName: str, collection_name: str, query: dict = {}, limit: int = None
+    databaseName: str,
+    collection_name: str,
+    query: dict = {},
+    limit: int = None,
+    projection: Optional[Dict[str, int]] = None,
 ):
     try:
         collection = connection_manager.get_collection(databaseName, collection_name)
-        cursor = collection.find(query) if query else collection.find()
-        if limit:
-            cursor = cursor.limit(limit)
-
-        # Use async comprehension to convert cursor to list
-        result = [doc async for doc in cursor]
+        cursor = _find(collection, query, limit, projection)
+        # Let the driver drain whole batches instead of looping per document
+        result = await cursor.to_list(length=limit or None)
         return result
     except PyMongoError as e:
         print(f"An error occurred while fetching multiple data: {e}")
         raise
 
 
+async def stream_data(
+    databaseName: str,
+    collection_name: str,
+    query: dict = {},
+    limit: int = None,
+    projection: Optional[Dict[str, int]] = None,
+):
+    """
+    Open a cursor and fetch its first document, then return an async generator
+    over all results. Errors from a bad filter or an unreachable server raise
+    here, before the caller has started a response.
+    """
+    cursor = None
+    try:
+        collection = connection_manager.get_collection(databaseName, collection_name)
+        cursor = _find(collection, query, limit, projection)
+        first = await anext(cursor, None)
+    except PyMongoError as e:
+        print(f"An error occurred while streaming data: {e}")
+        if cursor is not None:
+            await cursor.close()
+        raise
+    return _iter_cursor(cursor, first)
+
+
+async def _iter_cursor(cursor, first):
+    try:
+        if first is None:
+            return
+        yield first
+        async for doc in cursor:
+            yield doc
+    except PyMongoError as e:
+        print(f"An error occurred while streaming data: {e}")
+        raise
+    finally:
+        # Also runs when the client disconnects mid-stream
+        await cursor.close()
+
+
 async def data_update(
     databaseName: str, collection_name: str, filter: Dict, update: Dict
 ):
     try:
         collection = connection_manager.get_collection(databaseName, collection_name)
-        result = await collection.update_one(filter, update)
+        try:
+            result = await collection.update_one(filter, update)
+        finally:
+            # The write may have been applied even if the driver raised
+            _invalidate(databaseName, collection_name, filter)
         return result
     except PyMongoError as e:
         print(f"An error occurred while updating data: {e}")
         raise
 
 
+async def data_update_many(
+    databaseName: str, collection_name: str, updates: List[Tuple[Dict, Dict]]
+):
+    try:
+        collection = connection_manager.get_collection(databaseName, collection_name)
+        try:
+            result = await collection.bulk_write(
+                [UpdateOne(filter, update) for filter, update in updates],
+                ordered=False,
+            )
+        finally:
+            # Unordered writes can partially apply even when bulk_write raises
+            for filter, _ in updates:
+                _invalidate(databaseName, collection_name, filter)
+        return result
+    except PyMongoError as e:
+        print(f"An error occurred while updating multiple data: {e}")
+        raise
+
+
 async def data_delete(databaseName: str, collection_name: str, filter: Dict):
     try:
         collection = connection_manager.get_collection(databaseName, collection_name)
-        result = await collection.delete_one(filter)
+        try:
+            result = await collection.delete_one(filter)
+        finally:
+            # The write may have been applied even if the driver raised
+            _invalidate(databaseName, collection_name, filter)
         return result
     except PyMongoError as e:
         print(f"An error occurred while deleting data: {e}")
@@ -74,34 +243,29 @@ async def data_delete(databaseName: str, collection_name: str, filter: Dict):
 
 
 async def getBlogs(num: int = 10):
+    if not 1 <= num <= MAX_BLOG_POSTS:
+        raise ValueError(f"num must be between 1 and {MAX_BLOG_POSTS}")
+    edges = _BLOG_CACHE.get(num)
+    if edges is not None:
+        return edges
+
+    # Only one request per `num` refreshes an expired entry
+    lock = _BLOG_LOCKS.setdefault(num, asyncio.Lock())
+    async with lock:
+        edges = _BLOG_CACHE.get(num)
+        if edges is not None:
+            return edges
+        edges = await _fetch_blogs(num)
+        _BLOG_CACHE[num] = edges
+        return edges
+
+
+async def _fetch_blogs(num: int):
     try:
-        query = f"""query Publication {{
-          publication(host: "pratyaywrites.hashnode.dev") {{
-            posts(first: {num}) {{
-              edges {{
-                node {{
-                  id
-                  coverImage {{
-                    url
-                  }}
-                  title
-                  brief
-                  url
-                }}
-              }}
-            }}
-          }}
-        }}"""
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://gql.hashnode.com",
-                headers={
-                    "Content-Type": "application/json",
-                },
-                json={"query": query},
-            )
-            response.raise_for_status()  # Raise an exception for bad status codes
+        response = await _http_client().post(
+            "/", json={"query": _BLOGS_QUERY, "variables": {"first": num}}
+        )
+        response.raise_for_status()  # Raise an exception for bad status codes
         result = response.json()
 
         # Check if the response contains errors
@@ -120,6 +284,14 @@ async def getBlogs(num: int = 10):
         raise
 
 
+async def close_http_client():
+    """Close the shared Hashnode HTTP client; the next request opens a new one."""
+    global _HTTP
+    if _HTTP is not None:
+        client, _HTTP = _HTTP, None
+        await client.aclose()
+
+
 async def message_send(databaseName: str, collection_name: str, data: Dict[str, Any]):
     try:
         collection = connection_manager.get_collection(databaseName, collection_name)
@@ -134,7 +306,8 @@ async def message_receive(databaseName: str, collection_name: str, query: dict =
     try:
         collection = connection_manager.get_collection(databaseName, collection_name)
         cursor = collection.find(query) if query else collection.find()
-        result = [doc async for doc in cursor]
+        cursor = cursor.batch_size(MAX_BATCH_SIZE)
+        result = await cursor.to_list(length=None)
         return result
     except PyMongoError as e:
         print(f"An error occurred while receiving message: {e}")
@@ -144,7 +317,11 @@ async def message_receive(databaseName: str, collection_name: str, query: dict =
 async def message_delete(databaseName: str, collection_name: str, id: ObjectId):
     try:
         collection = connection_manager.get_collection(databaseName, collection_name)
-        result = await collection.delete_one({"_id": id})
+        try:
+            result = await collection.delete_one({"_id": id})
+        finally:
+            # The write may have been applied even if the driver raised
+            _invalidate(databaseName, collection_name, {"_id": id})
         return result
     except PyMongoError as e:
         print(f"An error occurred while deleting message: {e}")